@@ -231,7 +231,7 @@ class CardEnc(object):
                 if vpool.top <= vpool._occupied[0][1] + 1:
                     vpool.top = vpool._occupied[0][1] + 1
 
-                vpool._occupied.pop(0)
+                vpool._occupied.popleft()
 
             # mapping this literal to a free one
             vmap[top] = vpool.top
@@ -218,6 +218,7 @@ import collections
 import copy
 import decimal
 import itertools
+import operator
 import os
 from pysat._fileio import FileObject
 import sys
@@ -252,7 +253,9 @@ class IDPool(object):
         :type occupied: list(list(int))
     """
 
-    def __init__(self, start_from=1, occupied=[]):
+    __slots__ = ('top', '_occupied', 'obj2id', '_id2obj', '_pending')
+
+    def __init__(self, start_from=1, occupied=None):
         """
             Constructor.
         """
@@ -263,9 +266,9 @@ class IDPool(object):
         """
             State reproducible string representaion of object.
         """
-        return f"IDPool(start_from={self.top+1}, occupied={self._occupied})"
+        return f"IDPool(start_from={self.top+1}, occupied={list(self._occupied)})"
 
-    def restart(self, start_from=1, occupied=[]):
+    def restart(self, start_from=1, occupied=None):
         """
             Restart the manager from scratch. The arguments replicate those of
             the constructor of :class:`IDPool`.
@@ -275,14 +278,52 @@ class IDPool(object):
         self.top = start_from - 1
 
         # occupied IDs
-        self._occupied = sorted(occupied, key=lambda x: x[0])
+        if occupied:
+            self._occupied = collections.deque(sorted(occupied,
+                key=operator.itemgetter(0)))
+        else:
+            self._occupied = collections.deque()
 
         # main dictionary storing the mapping from objects to variable IDs
-        self.obj2id = collections.defaultdict(lambda: self._next())
+        self.obj2id = {}
 
         # mapping back from variable IDs to objects
-        # (if for whatever reason necessary)
-        self.id2obj = {}
+        # (built lazily, if for whatever reason necessary)
+        self._id2obj = {}
+
+        # (ID, object) pairs assigned by id() but not yet put in id2obj
+        self._pending = []
+
+    @property
+    def id2obj(self):
+        """
+            Mapping from variable IDs back to the objects they were assigned
+            to by :meth:`id`. As it is rarely needed, :meth:`id` only records
+            the newly assigned pairs while the dictionary itself is updated
+            with them on access. Direct modifications of ``obj2id`` are not
+            reflected in the mapping. The mapping can be modified or replaced
+            by the user.
+
+            :rtype: dict
+        """
+
+        if self._pending:
+            for vid, obj in self._pending:
+                self._id2obj.setdefault(vid, obj)
+
+            self._pending = []
+
+        return self._id2obj
+
+    @id2obj.setter
+    def id2obj(self, mapping):
+        """
+            Replace the mapping from variable IDs back to objects. The IDs
+            assigned by :meth:`id` afterwards are mapped in the new dictionary.
+        """
+
+        self._id2obj = mapping
+        self._pending = []
 
     def id(self, obj=None):
         """
@@ -328,10 +369,12 @@ class IDPool(object):
         """
 
         if obj is not None:
-            vid = self.obj2id[obj]
+            vid = self.obj2id.get(obj)
 
-            if vid not in self.id2obj:
-                self.id2obj[vid] = obj
+            if vid is None:
+                vid = self._next()
+                self.obj2id[obj] = vid
+                self._pending.append((vid, obj))
         else:
             # no object is provided => simply return a new ID
             vid = self._next()
@@ -356,10 +399,7 @@ class IDPool(object):
                 'hello_world!'
         """
 
-        if vid in self.id2obj:
-            return self.id2obj[vid]
-
-        return None
+        return self.id2obj.get(vid)
 
     def occupy(self, start, stop):
         """
@@ -374,8 +414,53 @@ class IDPool(object):
         """
 
         if stop >= start:
-            self._occupied.append([start, stop])
-            self._occupied.sort(key=lambda x: x[0])
+            if self._occupied and start < self._occupied[-1][0]:
+                self._occupied = collections.deque(sorted(
+                    itertools.chain(self._occupied, [[start, stop]]),
+                    key=operator.itemgetter(0)))
+            else:
+                self._occupied.append([start, stop])
+
+    def reserve(self, n):
+        """
+            Reserve a block of ``n`` consecutive variable IDs unassigned to
+            any object. The block skips all the occupied intervals and the
+            top variable ID is advanced past it at once, which is cheaper
+            than calling :meth:`id` ``n`` times when the number of required
+            auxiliary variables is known in advance. The method returns the
+            first and the last ID of the block (**inclusive**).
+
+            :param n: number of IDs to reserve (must be positive).
+            :type n: int
+
+            :rtype: tuple(int, int)
+
+            Example:
+
+            .. code-block:: python
+
+                >>> from pysat.formula import IDPool
+                >>> vpool = IDPool(occupied=[[4, 5]])
+                >>> vpool.reserve(2)
+                (1, 2)
+                >>> vpool.reserve(3)
+                (6, 8)
+                >>> vpool.id()
+                9
+        """
+
+        assert n > 0, 'A positive number of IDs is expected.'
+
+        start = self.top + 1
+
+        while self._occupied and start + n > self._occupied[0][0]:
+            if start <= self._occupied[0][1]:
+                start = self._occupied[0][1] + 1
+
+            self._occupied.popleft()
+
+        self.top = start + n - 1
+        return start, self.top
 
     def _next(self):
         """
@@ -388,7 +473,7 @@ class IDPool(object):
             if self.top <= self._occupied[0][1]:
                 self.top = self._occupied[0][1] + 1
 
-            self._occupied.pop(0)
+            self._occupied.popleft()
 
         return self.top
 
@@ -520,7 +605,7 @@ class CNF(object):
                 elif not line.startswith('p cnf '):
                     self.comments.append(line)
 
-        self.nv = max(map(lambda cl: max(map(abs, cl)), itertools.chain.from_iterable([[[self.nv]], self.clauses])))
+        self.nv = max(self.nv, max(map(abs, itertools.chain.from_iterable(self.clauses)), default=0))
 
     def from_string(self, string, comment_lead=['c']):
         """
@@ -573,10 +658,8 @@ class CNF(object):
                 5
         """
 
-        self.clauses = copy.deepcopy(clauses)
-
-        for cl in self.clauses:
-            self.nv = max([abs(l) for l in cl] + [self.nv])
+        self.clauses = [list(cl) for cl in clauses]
+        self.nv = max(self.nv, max(map(abs, itertools.chain.from_iterable(self.clauses)), default=0))
 
     def from_aiger(self, aig, vpool=None):
         """
@@ -638,7 +721,7 @@ class CNF(object):
 
         self.clauses = [list(cls) for cls in aig_cnf.clauses]
         self.comments = ['c ' + c.strip() for c in aig_cnf.comments]
-        self.nv = max(map(abs, itertools.chain(*self.clauses)))
+        self.nv = max(map(abs, itertools.chain.from_iterable(self.clauses)))
 
         # saving input and output variables
         self.inps = list(aig_cnf.input2lit.values())
@@ -647,8 +730,8 @@ class CNF(object):
     def copy(self):
         """
             This method can be used for creating a copy of a CNF object. It
-            creates another object of the :class:`CNF` class and makes use of
-            the *deepcopy* functionality to copy the clauses.
+            creates another object of the :class:`CNF` class and copies each
+            of the clauses.
 
             :return: an object of class :class:`CNF`.
 
@@ -666,8 +749,8 @@ class CNF(object):
 
         cnf = CNF()
         cnf.nv = self.nv
-        cnf.clauses = copy.deepcopy(self.clauses)
-        cnf.comments = copy.deepcopy(self.comments)
+        cnf.clauses = [cl[:] for cl in self.clauses]
+        cnf.comments = self.comments[:]
 
         return cnf
 
@@ -744,8 +827,8 @@ class CNF(object):
 
         print('p cnf', self.nv, len(self.clauses), file=file_pointer)
 
-        for cl in self.clauses:
-            print(' '.join(str(l) for l in cl), '0', file=file_pointer)
+        file_pointer.writelines(' '.join(map(str, cl)) + ' 0\n'
+                for cl in self.clauses)
 
     def to_dimacs(self):
         """
@@ -948,14 +1031,14 @@ class CNF(object):
 
         wcnf.nv = self.nv
         wcnf.hard = []
-        wcnf.soft = copy.deepcopy(self.clauses)
+        wcnf.soft = [cl[:] for cl in self.clauses]
         wcnf.wght = [1 for cl in wcnf.soft]
         wcnf.topw = len(wcnf.wght) + 1
         wcnf.comments = self.comments[:]
 
         return wcnf
 
-    def negate(self, topv=None):
+    def negate(self, topv=None, pg=False):
         """
             Given a CNF formula :math:`\mathcal{F}`, this method creates a CNF
             formula :math:`\\neg{\mathcal{F}}`. The negation of the formula is
@@ -967,10 +1050,27 @@ class CNF(object):
 
             **Note** that the negation of each clause is encoded with one
             auxiliary variable if it is not unit size. Otherwise, no auxiliary
-            variable is introduced.
+            variable is introduced. Repeated occurrences of the same clause,
+            i.e. of any clause having the same set of literals, reuse the
+            auxiliary variable introduced for its first occurrence and do not
+            give rise to any new clauses. Duplicate literals are ignored.
+            The negation of a tautological clause is unsatisfiable and so its
+            auxiliary variable is simply forced to be false. This way, the
+            literal ``enclits[i]`` always encodes the negation of clause
+            ``i`` of the original formula.
+
+            As the auxiliary variables occur only positively in the final
+            disjunction of ``enclits``, it suffices to encode one direction of
+            their definitions following Plaisted and Greenbaum [2]_. This can
+            be done by setting parameter ``pg`` to ``True``, in which case the
+            opposite implication clauses are not added. The result is
+            equisatisfiable with (but not equivalent to) the default encoding.
 
             :param topv: top variable identifier if any.
+            :param pg: use the Plaisted-Greenbaum encoding.
+
             :type topv: int
+            :type pg: bool
 
             :return: an object of class :class:`CNF`.
 
@@ -978,6 +1078,10 @@ class CNF(object):
                 propositional calculus*.  Studies in Mathematics and
                 Mathematical Logic, Part II. pp.  115–125, 1968
 
+            .. [2] David A. Plaisted, Steven Greenbaum. *A Structure-preserving
+                Clause Form Translation*. J. Symb. Comput. 2(3). pp. 293-304,
+                1986
+
             .. code-block:: python
 
                 >>> from pysat.formula import CNF
@@ -989,6 +1093,10 @@ class CNF(object):
                 [4]
                 >>> print(neg.enclits)  # literals encoding the negation of clauses
                 [4, -3]
+                >>>
+                >>> neg = pos.negate(pg=True)
+                >>> print(neg.clauses)
+                [[1, -4], [-2, -4], [4, -3]]
         """
 
         negated = CNF()
@@ -1001,26 +1109,48 @@ class CNF(object):
         negated.auxvars = []
         negated.enclits = []
 
+        # auxiliary variables of the clauses encoded so far
+        encoded = {}
+
         for cl in self.clauses:
             auxv = -cl[0]
             if len(cl) > 1:
-                negated.nv += 1
-                auxv = negated.nv
-
-                # direct implication
-                for l in cl:
-                    negated.clauses.append([-l, -auxv])
-
-                # opposite implication
-                negated.clauses.append(cl + [auxv])
-
-                # keeping all Tseitin variables
-                negated.auxvars.append(auxv)
+                key = frozenset(cl)
+                if key in encoded:
+                    negated.enclits.append(encoded[key])
+                    continue
+
+                # removing duplicate literals
+                lits = list(dict.fromkeys(cl))
+
+                auxv = -lits[0]
+                if len(set(map(abs, key))) < len(key):
+                    # the negation of a tautology is unsatisfiable
+                    negated.nv += 1
+                    auxv = negated.nv
+                    negated.clauses.append([-auxv])
+                    negated.auxvars.append(auxv)
+                elif len(lits) > 1:
+                    negated.nv += 1
+                    auxv = negated.nv
+
+                    # direct implication
+                    for l in lits:
+                        negated.clauses.append([-l, -auxv])
+
+                    # opposite implication
+                    if not pg:
+                        negated.clauses.append(lits + [auxv])
+
+                    # keeping all Tseitin variables
+                    negated.auxvars.append(auxv)
+
+                encoded[key] = auxv
 
             # literals representing negated clauses
             negated.enclits.append(auxv)
 
-        negated.clauses.append(negated.enclits)
+        negated.clauses.append(list(dict.fromkeys(negated.enclits)))
         return negated
 
 
@@ -1173,7 +1303,7 @@ class WCNF(object):
                     else: # preamble should be "p wcnf nvars nclauses", with topw omitted
                         self.topw = decimal.Decimal('+inf')
 
-        self.nv = max(map(lambda cl: max(map(abs, cl)), itertools.chain.from_iterable([[[self.nv]], self.hard, self.soft])))
+        self.nv = max(self.nv, max(map(abs, itertools.chain.from_iterable(itertools.chain(self.hard, self.soft))), default=0))
 
         # if there is any soft clause with negative weight
         # normalize it, i.e. transform into a set of clauses
@@ -1195,17 +1325,32 @@ class WCNF(object):
             :type negatives: list(list(int))
         """
 
+        # selectors of the clauses encoded so far
+        encoded = {}
+
         for cl, w in negatives:
+            # repeated literals make no difference, so a clause
+            # like [l, l] can be negated as a unit without Tseitin
+            if len(cl) > 1:
+                cl = list(dict.fromkeys(cl))
+
             selv = cl[0]
 
             # tseitin-encoding the clause if it is not unit-size
+            # and the same set of literals has not been seen before
             if len(cl) > 1:
-                self.nv += 1
-                selv = self.nv
+                key = frozenset(cl)
+                if key in encoded:
+                    selv = encoded[key]
+                else:
+                    self.nv += 1
+                    selv = self.nv
+
+                    for l in cl:
+                        self.hard.append([selv, -l])
+                    self.hard.append([-selv] + cl)
 
-                for l in cl:
-                    self.hard.append([selv, -l])
-                self.hard.append([-selv] + cl)
+                    encoded[key] = selv
 
             # adding the negation of the clause either as hard or soft
             if w >= self.topw:
@@ -1253,8 +1398,8 @@ class WCNF(object):
     def copy(self):
         """
             This method can be used for creating a copy of a WCNF object. It
-            creates another object of the :class:`WCNF` class and makes use of
-            the *deepcopy* functionality to copy both hard and soft clauses.
+            creates another object of the :class:`WCNF` class and copies each
+            of the hard and soft clauses.
 
             :return: an object of class :class:`WCNF`.
 
@@ -1280,10 +1425,10 @@ class WCNF(object):
         wcnf = WCNF()
         wcnf.nv = self.nv
         wcnf.topw = self.topw
-        wcnf.hard = copy.deepcopy(self.hard)
-        wcnf.soft = copy.deepcopy(self.soft)
-        wcnf.wght = copy.deepcopy(self.wght)
-        wcnf.comments = copy.deepcopy(self.comments)
+        wcnf.hard = [cl[:] for cl in self.hard]
+        wcnf.soft = [cl[:] for cl in self.soft]
+        wcnf.wght = self.wght[:]
+        wcnf.comments = self.comments[:]
 
         return wcnf
 
@@ -1362,11 +1507,12 @@ class WCNF(object):
 
         # soft clauses are dumped first because
         # some tools (e.g. LBX) cannot count them properly
-        for i, cl in enumerate(self.soft):
-            print(self.wght[i], ' '.join(str(l) for l in cl), '0', file=file_pointer)
+        file_pointer.writelines('{0} {1} 0\n'.format(w, ' '.join(map(str, cl)))
+                for cl, w in zip(self.soft, self.wght))
 
-        for cl in self.hard:
-            print(self.topw, ' '.join(str(l) for l in cl), '0', file=file_pointer)
+        topw = str(self.topw)
+        file_pointer.writelines('{0} {1} 0\n'.format(topw, ' '.join(map(str, cl)))
+                for cl in self.hard)
 
     def to_dimacs(self):
         """
@@ -1619,7 +1765,7 @@ class WCNF(object):
         cnf = CNF()
 
         cnf.nv = self.nv
-        cnf.clauses = copy.deepcopy(self.hard) + copy.deepcopy(self.soft)
+        cnf.clauses = [cl[:] for cl in itertools.chain(self.hard, self.soft)]
         cnf.commends = self.comments[:]
 
         return cnf
@@ -1742,7 +1888,7 @@ class CNFPlus(CNF, object):
                 elif not line.startswith('p cnf'):  # cnf is allowed here
                     self.comments.append(line)
 
-        self.nv = max(map(lambda cl: max(map(abs, cl)), itertools.chain.from_iterable([[[self.nv]], self.clauses])))
+        self.nv = max(self.nv, max(map(abs, itertools.chain.from_iterable(self.clauses)), default=0))
 
     def to_fp(self, file_pointer, comments=None):
         """
@@ -1782,11 +1928,11 @@ class CNFPlus(CNF, object):
         print('p', ftype, self.nv, len(self.clauses) + len(self.atmosts),
                 file=file_pointer)
 
-        for cl in self.clauses:
-            print(' '.join(str(l) for l in cl), '0', file=file_pointer)
+        file_pointer.writelines(' '.join(map(str, cl)) + ' 0\n'
+                for cl in self.clauses)
 
-        for am in self.atmosts:
-            print(' '.join(str(l) for l in am[0]), '<=', am[1], file=file_pointer)
+        file_pointer.writelines('{0} <= {1}\n'.format(' '.join(map(str, am[0])), am[1])
+                for am in self.atmosts)
 
     def to_dimacs(self):
         """
@@ -2053,7 +2199,7 @@ class CNFPlus(CNF, object):
 
         wcnf.nv = self.nv
         wcnf.hard = []
-        wcnf.soft = copy.deepcopy(self.clauses)
+        wcnf.soft = [cl[:] for cl in self.clauses]
         wcnf.atms = copy.deepcopy(self.atmosts)
         wcnf.wght = [1 for cl in wcnf.soft]
         wcnf.topw = len(wcnf.wght) + 1
@@ -2243,7 +2389,7 @@ class WCNFPlus(WCNF, object):
                     else: # preamble should be "p wcnf nvars nclauses", with topw omitted
                         self.topw = decimal.Decimal('+inf')
 
-        self.nv = max(map(lambda cl: max(map(abs, cl)), itertools.chain.from_iterable([[[self.nv]], self.hard, self.soft])))
+        self.nv = max(self.nv, max(map(abs, itertools.chain.from_iterable(itertools.chain(self.hard, self.soft))), default=0))
 
         # if there is any soft clause with negative weight
         # normalize it, i.e. transform into a set of clauses
@@ -2296,15 +2442,16 @@ class WCNFPlus(WCNF, object):
 
         # soft clauses are dumped first because
         # some tools (e.g. LBX) cannot count them properly
-        for i, cl in enumerate(self.soft):
-            print(self.wght[i], ' '.join(str(l) for l in cl), '0', file=file_pointer)
+        file_pointer.writelines('{0} {1} 0\n'.format(w, ' '.join(map(str, cl)))
+                for cl, w in zip(self.soft, self.wght))
 
-        for cl in self.hard:
-            print(self.topw, ' '.join(str(l) for l in cl), '0', file=file_pointer)
+        topw = str(self.topw)
+        file_pointer.writelines('{0} {1} 0\n'.format(topw, ' '.join(map(str, cl)))
+                for cl in self.hard)
 
         # atmost constraints are hard
-        for am in self.atms:
-            print(self.topw, ' '.join(str(l) for l in am[0]), '<=', am[1], file=file_pointer)
+        file_pointer.writelines('{0} {1} <= {2}\n'.format(topw, ' '.join(map(str, am[0])), am[1])
+                for am in self.atms)
 
     def to_dimacs(self):
         """
@@ -2563,7 +2710,7 @@ class WCNFPlus(WCNF, object):
         cnf = CNFPlus()
 
         cnf.nv = self.nv
-        cnf.clauses = copy.deepcopy(self.hard) + copy.deepcopy(self.soft)
+        cnf.clauses = [cl[:] for cl in itertools.chain(self.hard, self.soft)]
         cnf.atmosts = copy.deepcopy(self.atms)
         cnf.commends = self.comments[:]
 
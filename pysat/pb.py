@@ -226,7 +226,7 @@ class PBEnc(object):
                 if vpool.top <= vpool._occupied[0][1] + 1:
                     vpool.top = vpool._occupied[0][1] + 1
 
-                vpool._occupied.pop(0)
+                vpool._occupied.popleft()
 
             # mapping this literal to a free one
             vmap[top] = vpool.top
@@ -286,11 +286,11 @@ class PBEnc(object):
             assert len(lits) == len(weights), 'Same number of literals and weights is expected.'
             wlits = [pblib.WeightedLit(l, w) for l, w in zip(lits, weights)]
         else:
-            if all(map(lambda lw: (type(lw) in (list, tuple)) and len(lw) == 2, lits)):
+            if all(type(lw) in (list, tuple) and len(lw) == 2 for lw in lits):
                 # literals are already weighted
                 wlits = [pblib.WeightedLit(*wl) for wl in lits]
                 lits = zip(*lits)[0]  # unweighted literals for getting top_id
-            elif all(map(lambda l: type(l) is int, lits)):
+            elif all(type(l) is int for l in lits):
                 # no weights are provided => all weights are units
                 wlits = [pblib.WeightedLit(l, 1) for l in lits]
             else:
@@ -0,0 +1,16 @@
+from pysat.formula import CNF, WCNF, WCNFPlus
+
+def test_empty_clause():
+    cnf = CNF(from_string='p cnf 2 2\n-1 2 0\n0\n')
+    assert cnf.clauses == [[-1, 2], []]
+    assert cnf.nv == 2
+
+    cnf = CNF(from_clauses=[[], [3, -1]])
+    assert cnf.nv == 3
+
+    wcnf = WCNF(from_string='p wcnf 2 2 5\n5 0\n1 -2 0\n')
+    assert wcnf.hard == [[]] and wcnf.soft == [[-2]]
+    assert wcnf.nv == 2
+
+    wcnf = WCNFPlus(from_string='p wcnf+ 3 2 5\n5 0\n5 1 3 <= 1\n')
+    assert wcnf.hard == [[]] and wcnf.nv == 3
@@ -0,0 +1,85 @@
+import copy
+from pysat.formula import IDPool
+
+def test_occupied():
+    vpool = IDPool(occupied=[[12, 18], [3, 10]])
+    assert [vpool.id('v{0}'.format(i)) for i in range(5)] == [1, 2, 11, 19, 20]
+
+    vpool = IDPool()
+    vpool.occupy(5, 6)
+    vpool.occupy(2, 3)
+    vpool.occupy(9, 9)
+    assert repr(vpool) == 'IDPool(start_from=1, occupied=[[2, 3], [5, 6], [9, 9]])'
+    assert [vpool.id() for i in range(6)] == [1, 4, 7, 8, 10, 11]
+
+def test_copy():
+    vpool1 = IDPool()
+    vpool1.id('a')
+
+    vpool2 = copy.deepcopy(vpool1)
+    assert vpool2.id('b') == 2
+    assert vpool1.id('c') == 2
+    assert vpool2.obj(2) == 'b' and vpool1.obj(2) == 'c'
+
+def test_obj():
+    vpool = IDPool(occupied=[[2, 3]])
+    assert vpool.id('a') == 1 and vpool.obj(1) == 'a'
+    assert vpool.obj(4) is None
+
+    vpool.id()
+    vpool.id('b')
+    assert vpool.id2obj == {1: 'a', 5: 'b'}
+    assert vpool.obj(5) == 'b'
+
+    vpool.restart()
+    assert vpool.obj(1) is None
+
+def test_reserve():
+    vpool = IDPool(occupied=[[4, 5], [9, 9], [12, 20]])
+    assert vpool.reserve(2) == (1, 2)
+    assert vpool.reserve(3) == (6, 8)
+    assert vpool.reserve(2) == (10, 11)
+    assert vpool.id() == 21
+
+    vpool = IDPool(occupied=[[3, 3], [5, 6]])
+    vpool.id()
+    assert vpool.reserve(2) == (7, 8)
+
+def test_id2obj_update():
+    vpool = IDPool()
+    vpool.id('a')
+    vpool.id2obj[99] = 'z'
+    vpool.id('b')
+    assert vpool.id2obj == {1: 'a', 99: 'z', 2: 'b'}
+
+    vpool.id2obj = {}
+    vpool.id('c')
+    assert vpool.id2obj == {3: 'c'}
+    assert vpool.obj(1) is None and vpool.obj(3) == 'c'
+
+def test_reserve_nonpositive():
+    vpool = IDPool()
+    vpool.id('a')
+    vpool.id('b')
+
+    for n in (0, -1):
+        try:
+            vpool.reserve(n)
+            assert False, 'we should not get here'
+        except AssertionError:
+            pass
+
+    assert vpool.top == 2
+    assert vpool.id('c') == 3
+
+def test_id2obj_shrink():
+    vpool = IDPool()
+    vpool.id('a')
+    vpool.id('b')
+    assert vpool.obj(2) == 'b'
+
+    del vpool.obj2id['a']
+    vpool.id('c')
+    vpool.id('d')
+    assert vpool.obj(3) == 'c' and vpool.obj(4) == 'd'
+    assert vpool.obj(1) == 'a'
@@ -0,0 +1,42 @@
+from pysat.formula import CNF
+
+def test_negate_shared():
+    cnf = CNF(from_clauses=[[-1, 2], [3], [-1, 2]])
+    neg = cnf.negate()
+
+    assert neg.auxvars == [4]
+    assert neg.enclits == [4, -3, 4]
+    assert neg.clauses[:3] == [[1, -4], [-2, -4], [-1, 2, 4]]
+    assert len(neg.clauses) == 4
+
+def test_negate_redundant():
+    cnf = CNF(from_clauses=[[1, 2, 1], [3, -3], [4, 4], [-1, 2]])
+    neg = cnf.negate()
+
+    assert neg.auxvars == [5, 6, 7]
+    assert neg.enclits == [5, 6, -4, 7]
+    assert neg.clauses == [[-1, -5], [-2, -5], [1, 2, 5], [-6],
+            [1, -7], [-2, -7], [-1, 2, 7], [5, 6, -4, 7]]
+
+def test_negate_enclits():
+    cnf = CNF(from_clauses=[[1, -1], [2, 3], [-1, 1]])
+    neg = cnf.negate()
+
+    assert len(neg.enclits) == len(cnf.clauses)
+    assert neg.enclits == [4, 5, 4]
+    assert [-4] in neg.clauses
+
+def test_negate_pg():
+    cnf = CNF(from_clauses=[[-1, 2], [3], [-1, 2]])
+    neg = cnf.negate(pg=True)
+
+    assert neg.auxvars == [4]
+    assert neg.clauses == [[1, -4], [-2, -4], [4, -3]]
+
+def test_negate_structural():
+    cnf = CNF(from_clauses=[[-1, 2], [2, -1], [2, -1, 2]])
+    neg = cnf.negate()
+
+    assert neg.auxvars == [3]
+    assert neg.enclits == [3, 3, 3]
+    assert neg.clauses == [[1, -3], [-2, -3], [-1, 2, 3], [3]]
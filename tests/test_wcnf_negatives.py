@@ -0,0 +1,17 @@
+from pysat.formula import WCNF
+
+def test_negative_unit():
+    wcnf = WCNF(from_string='p wcnf 3 2 10\n10 -1 3 0\n-2 2 2 0\n')
+
+    assert wcnf.nv == 3
+    assert wcnf.hard == [[-1, 3]]
+    assert wcnf.soft == [[-2]]
+    assert wcnf.wght == [2]
+
+def test_negative_shared():
+    wcnf = WCNF(from_string='p wcnf 4 3 10\n10 -1 4 0\n-2 1 2 0\n-3 2 1 0\n')
+
+    assert wcnf.nv == 5
+    assert wcnf.hard == [[-1, 4], [5, -1], [5, -2], [-5, 1, 2]]
+    assert wcnf.soft == [[-5], [-5]]
+    assert wcnf.wght == [2, 3]